@@ -1,4 +1,5 @@
 from timefhuman import timefhuman
+from timefhuman import timefhuman_many
 import datetime
 import pytest
 
@@ -46,7 +47,6 @@ def test_choices(now):
 
 
 def test_multiple_choices(now):
-    print(timefhuman('7/17, 7/18, 7/19 at 2', now, raw=True))
     assert timefhuman('7/17, 7/18, 7/19 at 2', now) == [
         datetime.datetime(2018, 7, 17, 2, 0),
         datetime.datetime(2018, 7, 18, 2, 0),
@@ -83,4 +83,57 @@ def test_multiple_datetimes(now):
     assert timefhuman('6/28 5:00 PM - 8/02 7:00 PM', now) == \
         (datetime.datetime(2018, 6, 28, 17, 0), datetime.datetime(2018, 8, 2, 19, 0))
     assert timefhuman('6/28/2019 5:00 PM - 8/02/2019 7:00 PM', now) == \
-        (datetime.datetime(2019, 6, 28, 17, 0), datetime.datetime(2019, 8, 2, 19, 0))
\ No newline at end of file
+        (datetime.datetime(2019, 6, 28, 17, 0), datetime.datetime(2019, 8, 2, 19, 0))
+
+
+def test_time_only(now):
+    assert timefhuman('3:30 P.M.', now) == datetime.datetime(2018, 8, 4, 15, 30)
+    assert timefhuman('15:00', now) == datetime.datetime(2018, 8, 4, 15, 0)
+
+
+def test_cache(now):
+    first = timefhuman('7/17 4 or 5 PM', now)
+    first.append(None)
+    assert timefhuman('7/17 4 or 5 PM', now) == [
+        datetime.datetime(2018, 7, 17, 16, 0),
+        datetime.datetime(2018, 7, 17, 17, 0),
+    ]
+    assert timefhuman('7/17 4 or 5 PM', now, cache=False) == \
+        timefhuman('7/17 4 or 5 PM', now)
+
+
+def test_iso(now):
+    assert timefhuman('2018-07-17', now) == datetime.datetime(2018, 7, 17, 0, 0)
+    assert timefhuman('2018-07-17T15:30', now) == \
+        datetime.datetime(2018, 7, 17, 15, 30)
+
+
+def test_repeated_time_of_day(now):
+    assert timefhuman('10:30 Monday AM', now) == \
+        datetime.datetime(2018, 8, 6, 10, 30)
+    assert timefhuman('3pm AM', now) == datetime.datetime(2018, 8, 4, 15, 0)
+
+
+def test_bare_month_then_month_day(now):
+    assert timefhuman('December or July 17', now) == [
+        datetime.datetime(2018, 12, 1, 0, 0),
+        datetime.datetime(2018, 7, 17, 0, 0),
+    ]
+    assert timefhuman('August or July 17', now) == [
+        datetime.datetime(2018, 8, 4, 0, 0),
+        datetime.datetime(2018, 7, 17, 0, 0),
+    ]
+
+
+def test_date_as_now():
+    today = datetime.date(2018, 8, 4)
+    assert timefhuman('upcoming Monday noon', today) == \
+        datetime.datetime(2018, 8, 6, 12, 0)
+    assert timefhuman('3pm', today) == datetime.datetime(2018, 8, 4, 15, 0)
+    assert timefhuman('7/17 3 pm', today) == datetime.datetime(2018, 7, 17, 15, 0)
+    assert timefhuman('tomorrow', today) == datetime.datetime(2018, 8, 5, 0, 0)
+    assert timefhuman('July 17', today) == datetime.datetime(2018, 7, 17, 0, 0)
+    assert timefhuman_many(['3pm', 'tomorrow'], today) == [
+        datetime.datetime(2018, 8, 4, 15, 0),
+        datetime.datetime(2018, 8, 5, 0, 0),
+    ]
@@ -1 +1,2 @@
 from .main import timefhuman
+from .main import timefhuman_many
@@ -1,5 +1,6 @@
 from .constants import MONTHS
 from .constants import DAYS_OF_WEEK
+from .constants import NUMBER_WORDS
 from .data import DayToken
 from .data import TimeToken
 from .data import DayRange
@@ -8,6 +9,26 @@ from .data import AmbiguousToken
 from .data import Token
 
 import datetime
+import re
+
+
+NUMBER_WORD_LOOKUP = {word: str(number) for number, word in enumerate(NUMBER_WORDS)}
+MONTH_LOOKUP = {spelling.lower(): number
+                for number, month in enumerate(MONTHS, start=1)
+                for spelling in (month, month[:3])}
+RELATIVE_DAY_OFFSETS = {'today': 0, 'tomorrow': 1, 'tmw': 1, 'yesterday': -1}
+RELATIVE_DAY_RANGES = {'weekend': ('Saturday', 1), 'weekdays': ('Monday', 4)}
+DAY_OF_WEEK_LOOKUP = {spelling.lower(): weekday
+                      for weekday, day_of_week in enumerate(DAYS_OF_WEEK)
+                      for spelling in (day_of_week, day_of_week[:2],
+                                       day_of_week[:3], day_of_week[:4])}
+TIME_OF_DAY_LOOKUP = {'morning': (9, 'am'), 'noon': (12, 'pm'),
+                      'afternoon': (3, 'pm'), 'evening': (6, 'pm'),
+                      'night': (9, 'pm'), 'midnight': (12, 'am')}
+WEEK_OFFSETS = {'next': 1, 'upcoming': 0, 'previous': -1, 'prev': -1,
+                'last': -1, 'past': -1}
+# (month)(punctuation)(day), optionally followed by the same punctuation and year
+DATE_PATTERN = re.compile(r'^(\d+)([/.\-])(\d+)(?:\2(\d+))?$')
 
 
 def categorize(tokens, now):
@@ -48,16 +69,15 @@ def convert_words_to_numbers(tokens):
     >>> convert_words_to_numbers(['seven', "o'clock"])
     ['7', "o'clock"]
     """
-    number_words = ["zero", "one", "two", "three", "four", "five", "six",
-                    "seven", "eight", "nine", "ten", "eleven", "twelve"]
     for index, token in enumerate(tokens):
-        if token.lower() in number_words:
-            tokens[index] = str(number_words.index(token.lower()))
+        number = NUMBER_WORD_LOOKUP.get(token.lower())
+        if number is not None:
+            tokens[index] = number
     return tokens
 
 
 # TODO: "monday next week"
-def convert_day_of_week(tokens, now=datetime.datetime.now()):
+def convert_day_of_week(tokens, now=None):
     """Convert day-of-week vernacular into date-like string.
 
     WARNING: assumes that 'upcoming', and (no specification) implies
@@ -77,22 +97,22 @@ def convert_day_of_week(tokens, now=datetime.datetime.now()):
     >>> convert_day_of_week(['suNday', 'at', '5'], now)
     [8/5/2018, 'at', '5']
     """
-    tokens = tokens.copy()
-    for i in range(7):
-        day = now + datetime.timedelta(i)
-        day_of_week = DAYS_OF_WEEK[day.weekday()]
-
-        for string in (day_of_week, day_of_week[:2], day_of_week[:3], day_of_week[:4]):
-            for index, token in enumerate(tokens):
-                if isinstance(token, str) and string.lower() == token.lower():
-                    new_index, tokens, weeks = extract_weeks_offset(tokens, end=index)
-                    day = now + datetime.timedelta(weeks*7 + i)
-                    tokens[new_index] = DayToken(day.month, day.day, day.year)
-                    break
-    return tokens
-
-
-def convert_relative_days_ranges(tokens, now=datetime.datetime.now()):
+    if now is None:
+        now = datetime.datetime.now()
+    substituted = []
+    for token in tokens:
+        weekday = DAY_OF_WEEK_LOOKUP.get(token.lower()) \
+            if isinstance(token, str) else None
+        if weekday is not None:
+            weeks = pop_weeks_offset(substituted)
+            days = (weekday - now.weekday()) % 7
+            day = now + datetime.timedelta(weeks*7 + days)
+            token = DayToken(day.month, day.day, day.year)
+        substituted.append(token)
+    return substituted
+
+
+def convert_relative_days_ranges(tokens, now=None):
     """Convert relative days (e.g., "today", "tomorrow") into date-like string.
 
     Additionally converts known ranges (e.g., "weekend", "weekdays")
@@ -105,57 +125,53 @@ def convert_relative_days_ranges(tokens, now=datetime.datetime.now()):
     >>> convert_relative_days_ranges(['weekdays'], now)
     [8/6/2018 - 8/10/2018]
     """
+    if now is None:
+        now = datetime.datetime.now()
     # TODO: what if user says 'this weekend' and it is currently the weekend?
     # for weekends, use 'next' as +1 and this weekend is the ranging including
     # today
     # TODO: add support for 'next weekday' (not daterange, conditioinal lookahead)
-    (saturday,) = convert_day_of_week(['upcoming', 'Saturday'], now)
-    (monday,) = convert_day_of_week(['upcoming', 'Monday'], now)
-    for keywords, replacement in (
-            (("today",), DayToken.from_datetime(now)),
-            (("tomorrow", "tmw"), DayToken.from_datetime(now + datetime.timedelta(1))),
-            (("yesterday",), DayToken.from_datetime(now - datetime.timedelta(1))),
-            (("weekend",), DayRange(saturday, saturday + 1)),
-            (("weekdays",), DayRange(monday, monday + 4))):
-        for keyword in keywords:
-            tokens = [replacement if token == keyword else token \
-                        for token in tokens]
+    tokens = list(tokens)
+    for index, token in enumerate(tokens):
+        if not isinstance(token, str):
+            continue
+        if token in RELATIVE_DAY_OFFSETS:
+            day = now + datetime.timedelta(RELATIVE_DAY_OFFSETS[token])
+            tokens[index] = DayToken.from_datetime(day)
+        elif token in RELATIVE_DAY_RANGES:
+            day_of_week, length = RELATIVE_DAY_RANGES[token]
+            (start,) = convert_day_of_week(['upcoming', day_of_week], now)
+            tokens[index] = DayRange(start, start + length)
     return tokens
 
 
 # TODO: convert to new token-based system
-def extract_weeks_offset(tokens, end=None, key_tokens=(
-        'next', 'previous', 'last', 'upcoming', 'past', 'prev')):
-    """Extract the number of week offsets needed.
-
-    >>> extract_weeks_offset(['next', 'next', 'week'])
-    (0, ['week'], 2)
-    >>> extract_weeks_offset(['upcoming', 'Monday'])
-    (0, ['Monday'], 0)
-    >>> extract_weeks_offset(['last', 'Monday'])
-    (0, ['Monday'], -1)
-    >>> extract_weeks_offset(['past', 'Tuesday'])
-    (0, ['Tuesday'], -1)
-    >>> extract_weeks_offset(['past', 'Wed', 'next', 'week'], end=1)
-    (0, ['Wed', 'next', 'week'], -1)
+def pop_weeks_offset(tokens, key_tokens=WEEK_OFFSETS):
+    """Pop trailing week modifiers off tokens and return the week offset.
+
+    >>> tokens = ['at', 'next', 'next']
+    >>> pop_weeks_offset(tokens), tokens
+    (2, ['at'])
+    >>> tokens = ['next', 'upcoming']
+    >>> pop_weeks_offset(tokens), tokens
+    (0, ['next'])
+    >>> tokens = ['upcoming', 'previous']
+    >>> pop_weeks_offset(tokens), tokens
+    (0, [])
+    >>> tokens = ['last']
+    >>> pop_weeks_offset(tokens), tokens
+    (-1, [])
+    >>> tokens = ['past', 'Wed']
+    >>> pop_weeks_offset(tokens), tokens
+    (0, ['past', 'Wed'])
     """
     offset = 0
-    end = len(tokens) - 1 if end is None else end
-    start = end - 1
-    if start < 0 or start >= len(tokens):
-        return 0, tokens, 0
-
-    while len(tokens) > start >= 0 and \
-            tokens[start] in key_tokens:
-        candidate = tokens[start]
-        if candidate == 'upcoming':
-            return start, tokens[:end-1] + tokens[end:], 0
-        if candidate == 'next':
-            offset += 1
-        elif candidate in ('previous', 'prev', 'last', 'past'):
-            offset -= 1
-        start -= 1
-    return start + 1, tokens[:start + 1] + tokens[end:], offset
+    while tokens and isinstance(tokens[-1], str) and tokens[-1] in key_tokens:
+        candidate = tokens.pop()
+        if candidate == 'upcoming':  # overrides any modifiers after it
+            return 0
+        offset += key_tokens[candidate]
+    return offset
 
 
 def convert_time_of_day(tokens):
@@ -171,22 +187,18 @@ def convert_time_of_day(tokens):
     ['Wed', 9 am]
     >>> convert_time_of_day(['Thu', 'midnight'])
     ['Thu', 12 am]
+    >>> convert_time_of_day(['noon', 'or', 'Noon'])
+    [12 pm, 'or', 12 pm]
     """
-    temp_tokens = [token.lower() if isinstance(token, str) else token for token in tokens]
-    for keyword, time_tokens in (
-            ('morning', [TimeToken(9, 'am')]),
-            ('noon', [TimeToken(12, 'pm')]),
-            ('afternoon', [TimeToken(3, 'pm')]),
-            ('evening', [TimeToken(6, 'pm')]),
-            ('night', [TimeToken(9, 'pm')]),
-            ('midnight', [TimeToken(12, 'am')])):
-        if keyword in temp_tokens:
-            index = temp_tokens.index(keyword)
-            tokens = tokens[:index] + time_tokens + tokens[index+1:]
-    return tokens
+    substituted = []
+    for token in tokens:
+        time = TIME_OF_DAY_LOOKUP.get(token.lower()) \
+            if isinstance(token, str) else None
+        substituted.append(token if time is None else TimeToken(*time))
+    return substituted
 
 
-def maybe_substitute_using_month(tokens, now=datetime.datetime.now()):
+def maybe_substitute_using_month(tokens, now=None):
     """
 
     >>> now = datetime.datetime(year=2018, month=7, day=7)
@@ -202,6 +214,10 @@ def maybe_substitute_using_month(tokens, now=datetime.datetime.now()):
     [8/1/2018, 'at']
     >>> maybe_substitute_using_month(['gibberish'], now=now)
     ['gibberish']
+    >>> maybe_substitute_using_month(['July'], now=now)
+    [7/7/2018]
+    >>> maybe_substitute_using_month(['December', 'or', 'July', '17'], now=now)
+    [12/1/2018, 'or', 7/17/2018]
     >>> time_range = TimeRange(TimeToken(3, 'pm'), TimeToken(5, 'pm'))
     >>> day_range = DayRange(DayToken(None, 3, None), DayToken(None, 5, None))
     >>> day = DayToken(3, 5, 2018)
@@ -209,30 +225,26 @@ def maybe_substitute_using_month(tokens, now=datetime.datetime.now()):
     >>> maybe_substitute_using_month(['May', ambiguous_token], now=now)
     [5/3/2018 - 5/5/2018]
     """
-    temp_tokens = [token.lower() if isinstance(token, str) else token for token in tokens]
-    for mo, month in enumerate(MONTHS, start=1):
-
-        index = None
-        month = month.lower()
-        if month in temp_tokens:
-            index = temp_tokens.index(month)
-        if month[:3] in temp_tokens:
-            index = temp_tokens.index(month[:3])
-
-        if index is None:
+    if now is None:
+        now = datetime.datetime.now()
+    for index, token in enumerate(tokens):
+        if not isinstance(token, str):
+            continue
+        mo = MONTH_LOOKUP.get(token.lower())
+        if mo is None:
             continue
 
-        next_candidate = tokens[index+1]
+        next_candidate = tokens[index+1] if len(tokens) > index+1 else ''
         day = 1 if now.month != mo else now.day
         if isinstance(next_candidate, AmbiguousToken):
-            if next_candidate.has_day_range_token():
-                day_range = next_candidate.get_day_range_token()
+            day_range = next_candidate.get_day_range_token()
+            if day_range is not None:
                 day_range.apply_month(mo)
                 day_range.apply_year(now.year)  # TODO: fails on July 3-5, 2018
-                return tokens[:index] + [day_range] + tokens[index+2:]
+                return maybe_substitute_using_month(tokens[:index] + [day_range] + tokens[index+2:], now)
         if not next_candidate.isnumeric():
             day = DayToken(month=mo, day=day, year=now.year)
-            return tokens[:index] + [day] + tokens[index+1:]
+            return maybe_substitute_using_month(tokens[:index] + [day] + tokens[index+1:], now)
 
         # allow formats July 17, 2018. Do not consume comma if July 17, July 18 ...
         next_candidate = int(next_candidate)
@@ -245,7 +257,7 @@ def maybe_substitute_using_month(tokens, now=datetime.datetime.now()):
         if next_candidate > 31:
             day = 1 if now.month != mo else now.day
             day = DayToken(month=mo, day=day, year=next_candidate)
-            return tokens[:index] + [day] + tokens[index+2:]
+            return maybe_substitute_using_month(tokens[:index] + [day] + tokens[index+2:], now)
         elif not next_next_candidate.isnumeric():
             day = DayToken(month=mo, day=next_candidate, year=now.year)
             return maybe_substitute_using_month(tokens[:index] + [day] + tokens[index+2:], now)
@@ -256,7 +268,7 @@ def maybe_substitute_using_month(tokens, now=datetime.datetime.now()):
     return tokens
 
 
-def maybe_substitute_using_date(tokens, now=datetime.datetime.now()):
+def maybe_substitute_using_date(tokens, now=None):
     """Attempt to extract dates.
 
     Look for dates in the form of the following:
@@ -280,34 +292,39 @@ def maybe_substitute_using_date(tokens, now=datetime.datetime.now()):
     >>> maybe_substitute_using_date(['7/4', '-', '7/6'], now=now)
     [7/4/2018, '-', 7/6/2018]
     """
-    i = 0
-    while i < len(tokens):
-        token = tokens[i]
-        if isinstance(token, Token):
-            i += 1
+    if now is None:
+        now = datetime.datetime.now()
+    substituted = []
+    for token in tokens:
+        match = DATE_PATTERN.match(token) if isinstance(token, str) else None
+        if match is None:
+            substituted.append(token)
             continue
-        for punctuation in ('/', '.', '-'):
-            if punctuation == token:  # dash joins other tokens, skip parsing
-                continue
-            if punctuation not in token:
-                continue
-
-            parts = tuple(map(int, token.split(punctuation)))
-            if len(parts) == 2:
-                day = DayToken(month=parts[0], day=parts[1], year=now.year)
-                if punctuation == '-' and parts[1] <= 24:
-                    day = AmbiguousToken(
-                        day, extract_hour_minute(token))
-                tokens = tokens[:i] + [day] + tokens[i+1:]
-                continue
-
-            month, day, year = parts
-            if year < 1000:
-                year = year + 2000 if year < 50 else year + 1000
-            day = DayToken(month=month, day=day, year=year)
-            tokens = tokens[:i] + [day] + tokens[i+1:]
-        i += 1
-    return tokens
+
+        month, punctuation, day, year = match.groups()
+        if year is not None:
+            token = DayToken(month=int(month), day=int(day), year=expand_year(int(year)))
+        elif punctuation == '-' and int(day) <= 24:
+            token = AmbiguousToken(
+                DayToken(month=int(month), day=int(day), year=now.year),
+                extract_hour_minute(token))
+        else:
+            token = DayToken(month=int(month), day=int(day), year=now.year)
+        substituted.append(token)
+    return substituted
+
+
+def expand_year(year):
+    """Expand abbreviated years (e.g., 18 to 2018).
+
+    >>> expand_year(18)
+    2018
+    >>> expand_year(2019)
+    2019
+    """
+    if year < 1000:
+        year = year + 2000 if year < 50 else year + 1000
+    return year
 
 
 def extract_hour_minute(string, time_of_day=None):
@@ -332,9 +349,7 @@ def extract_hour_minute(string, time_of_day=None):
     >>> extract_hour_minute(AmbiguousToken(day))
     """
     if isinstance(string, AmbiguousToken):
-        if string.has_time_range_token():
-            return string.get_time_range_token()
-        return None
+        return string.get_time_range_token()
 
     if '-' in string:
         times = string.split('-')
@@ -352,29 +367,30 @@ def extract_hour_minute_token(tokens, time_of_day=None):
     """
         Attempt to extract the exact token which contains the hour and minute and convert it into a number.
         This will either be 1 before or 2 before the am/pm token.
-        12:00 is the default token to prevent failure
+        Only strings are candidates; the search stops at already-converted tokens.
+        Returns (0, None) if no hour is found.
         Tests for this helper function are included in maybe_substitute_hour_minute
         >>> extract_hour_minute_token(["3", "o'clock"])
         (-2, 3:00)
         >>> extract_hour_minute_token(["Gibberish", "twice"])
-        (-1, 12)
+        (0, None)
         >>> extract_hour_minute_token(["only one value"])
-        (-1, 12)
+        (0, None)
+        >>> extract_hour_minute_token(["3", DayToken(8, 6, 2018)])
+        (0, None)
     """
 
     # look at previous n tokens
     n = 2
-    for i in range(1, n+1):
+    for i in range(1, min(n, len(tokens))+1):
+        if not isinstance(tokens[-i], str):
+            break
         try:
             return -i, extract_hour_minute(tokens[-i], time_of_day)
         # if nothing is returned from extract_hour_minute
         except ValueError:
             pass
-        # if the tokens list is only of length 1
-        except IndexError:
-            pass
-    # default return value
-    return -1, 12
+    return 0, None
 
 
 def maybe_substitute_hour_minute(tokens):
@@ -405,16 +421,25 @@ def maybe_substitute_hour_minute(tokens):
     [5 pm]
     >>> maybe_substitute_hour_minute(['12', "o'clock", 'pm'])
     [12 pm]
+    >>> maybe_substitute_hour_minute(['3', 'pm', 'am'])
+    [3 pm, 'am']
     """
     remove_dots = lambda token: token.replace('.', '')
-    temp_tokens = clean_tokens(tokens, remove_dots)
 
-    for time_of_day in ('am', 'pm'):
-        while time_of_day in temp_tokens:
-            index = temp_tokens.index(time_of_day)
-            (unchanged_index, time_token) = extract_hour_minute_token(temp_tokens[:index], time_of_day)
-            tokens = tokens[:index+unchanged_index] + [time_token] + tokens[index+1:]
-            temp_tokens = clean_tokens(tokens, remove_dots)
+    substituted = []
+    for token in tokens:
+        time_of_day = remove_dots(token.lower()) if isinstance(token, str) else None
+        if time_of_day not in ('am', 'pm'):
+            substituted.append(token)
+            continue
+        # only the hour and minute tokens just before am/pm are candidates
+        (unchanged_index, time_token) = extract_hour_minute_token(
+            clean_tokens(substituted[-2:], remove_dots), time_of_day)
+        if time_token is None:
+            substituted.append(token)
+            continue
+        substituted[len(substituted) + unchanged_index:] = [time_token]
+    tokens = substituted
 
     tokens = [extract_hour_minute(token, None)
         if isinstance(token, str) and ':' in token else token
@@ -434,7 +459,7 @@ def clean_tokens(tokens, callback=lambda token: token):
             else token for token in tokens]
 
 
-def substitute_hour_minute_in_remaining(tokens, now=datetime.datetime.now()):
+def substitute_hour_minute_in_remaining(tokens, now=None):
     """Sketch collector for leftovers integers.
 
     >>> substitute_hour_minute_in_remaining(['gibberish'])
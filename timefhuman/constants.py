@@ -22,3 +22,19 @@ DAYS_OF_WEEK = (
     'Saturday',
     'Sunday'
 )
+
+NUMBER_WORDS = (
+    'zero',
+    'one',
+    'two',
+    'three',
+    'four',
+    'five',
+    'six',
+    'seven',
+    'eight',
+    'nine',
+    'ten',
+    'eleven',
+    'twelve'
+)
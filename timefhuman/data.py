@@ -1,16 +1,21 @@
 import datetime
 
 
+# hour offsets keyed on (time of day, whether the relative hour is 12)
+HOUR_SHIFTS = {('pm', False): 12, ('am', True): -12}
+
+
 class Token:
 
+    __slots__ = ()
+
     def share(self, property, other, setter=setattr):
         """
-        >>> t1 = Token()
-        >>> t2 = Token()
-        >>> t1.is_special = True
-        >>> t1.share('is_special', t2)
-        >>> t2.is_special
-        True
+        >>> t1 = DayToken(7, 5, None)
+        >>> t2 = DayToken(None, 6, 2018)
+        >>> t1.share('year', t2)
+        >>> t1.year
+        2018
         """
         mine = getattr(self, property, None)
         others = getattr(other, property, None)
@@ -25,6 +30,8 @@ class Token:
 
 class ListToken(Token):
 
+    __slots__ = ('tokens',)
+
     def __init__(self, *tokens):
         self.tokens = list(tokens)
 
@@ -45,8 +52,22 @@ class ListToken(Token):
         return '[{}]'.format(', '.join(tokens))
 
 
+class RangeToken(Token):
+
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def datetime(self, now):
+        return (self.start.datetime(now), self.end.datetime(now))
+
+
 class DayTimeToken(Token):
 
+    __slots__ = ('day', 'time')
+
     def __init__(self, year, month, day, relative_hour, minute=0, time_of_day=None):
         self.day = DayToken(month, day, year)
         self.time = TimeToken(relative_hour, time_of_day, minute)
@@ -84,7 +105,7 @@ class DayTimeToken(Token):
         return '{} {}'.format(repr(self.day), repr(self.time))
 
 
-class DayTimeRange(Token):
+class DayTimeRange(RangeToken):
     """
     >>> dt1 = DayTimeToken(2018, 8, 1, 10)
     >>> dt2 = DayTimeToken(2018, 8, 1, 11)
@@ -98,12 +119,7 @@ class DayTimeRange(Token):
     8/1/2018 10:00 - 8/3/2018 11:00
     """
 
-    def __init__(self, start, end):
-        self.start = start
-        self.end = end
-
-    def datetime(self, now):
-        return (self.start.datetime(now), self.end.datetime(now))
+    __slots__ = ()
 
     def __repr__(self):
         if self.start.day == self.end.day:
@@ -123,11 +139,14 @@ class DayTimeList(ListToken):
     >>> dts.datetime(now)
     [datetime.datetime(2018, 8, 1, 10, 0), datetime.datetime(2018, 8, 1, 11, 0)]
     """
-    pass
+
+    __slots__ = ()
 
 
 class DayToken(Token):
 
+    __slots__ = ('month', 'day', 'year')
+
     def __init__(self, month, day, year):   # TODO: default Nones?
         self.month = month
         self.day = day
@@ -219,11 +238,9 @@ class DayToken(Token):
             self.month, self.day, self.year)
 
 
-class DayRange(Token):
+class DayRange(RangeToken):
 
-    def __init__(self, start, end):
-        self.start = start
-        self.end = end
+    __slots__ = ()
 
     def apply_month(self, month):
         self.start.month = month
@@ -233,9 +250,6 @@ class DayRange(Token):
         self.start.year = year
         self.end.year = year
 
-    def datetime(self, now):
-        return (self.start.datetime(now), self.end.datetime(now))
-
     def combine(self, time):
         assert isinstance(time, (TimeRange, TimeToken))
         if isinstance(time, TimeToken):
@@ -270,6 +284,8 @@ class DayList(ListToken):
     True
     """
 
+    __slots__ = ()
+
     def combine(self, other):
         if isinstance(other, (TimeRange, TimeToken, DayTimeToken)):
             return DayTimeList(*[token.combine(other) for token in self.tokens])
@@ -299,6 +315,8 @@ class TimeToken(Token):
     12 pm
     """
 
+    __slots__ = ('relative_hour', 'minute', 'time_of_day', 'hour')
+
     def __init__(self, relative_hour, time_of_day=None, minute=0):
         self.relative_hour = relative_hour
         self.minute = minute
@@ -309,17 +327,10 @@ class TimeToken(Token):
             self.relative_hour = relative_hour - 12
             self.hour = relative_hour
             self.time_of_day = 'pm'
-        elif time_of_day == 'pm' and relative_hour == 12:
-            self.hour = 12
-        elif time_of_day == 'pm' and relative_hour != 12:
-            self.hour = self.relative_hour + 12
-        elif time_of_day == 'am' and relative_hour == 12:
-            self.hour = 0
-        elif relative_hour == 12:
-            self.hour = 12
-            self.time_of_day = 'pm'
         else:
-            self.hour = self.relative_hour
+            if relative_hour == 12 and time_of_day is None:
+                self.time_of_day = 'pm'
+            self.hour = TimeToken.to_hour(relative_hour, self.time_of_day)
 
         assert 0 <= self.hour < 24
         assert 0 <= self.minute < 60
@@ -340,6 +351,21 @@ class TimeToken(Token):
         return '{}:{:02d} {}'.format(
             self.relative_hour, self.minute, self.time_of_day)
 
+    @staticmethod
+    def to_hour(relative_hour, time_of_day):
+        """
+        >>> TimeToken.to_hour(3, 'pm')
+        15
+        >>> TimeToken.to_hour(12, 'pm')
+        12
+        >>> TimeToken.to_hour(12, 'am')
+        0
+        >>> TimeToken.to_hour(3, None)
+        3
+        """
+        return relative_hour + HOUR_SHIFTS.get(
+            (time_of_day, relative_hour == 12), 0)
+
     @staticmethod
     def update_time_of_day(self, _, time_of_day):
         """
@@ -354,13 +380,13 @@ class TimeToken(Token):
         3 am
         >>> time.hour
         3
+        >>> time = TimeToken(3)
+        >>> TimeToken.update_time_of_day(time, None, 'am')
+        >>> time.hour
+        3
         """
-        if time_of_day != self.time_of_day:
-            if time_of_day == 'pm':
-                self.hour += 12
-            else:
-                self.hour -= 12
-            self.time_of_day = time_of_day
+        self.hour = TimeToken.to_hour(self.relative_hour, time_of_day)
+        self.time_of_day = time_of_day
 
     def apply(self, other):
         assert isinstance(other, TimeToken)
@@ -370,14 +396,9 @@ class TimeToken(Token):
         return self.string()
 
 
-class TimeRange(Token):
+class TimeRange(RangeToken):
 
-    def __init__(self, start, end):
-        self.start = start
-        self.end = end
-
-    def datetime(self, now):
-        return (self.start.datetime(now), self.end.datetime(now))
+    __slots__ = ()
 
     def __repr__(self):
         if self.start.time_of_day == self.end.time_of_day != None:
@@ -405,6 +426,8 @@ class TimeList(ListToken):
     True
     """
 
+    __slots__ = ()
+
     def combine(self, other):
         if isinstance(other, (DayRange, DayToken)):
             return DayTimeList(*[other.combine(token) for token in self.tokens])
@@ -428,32 +451,31 @@ class AmbiguousToken(Token):
     datetime.datetime(2018, 1, 1, 15, 0)
     """
 
+    __slots__ = ('tokens', 'tokens_by_type')
+
     def __init__(self, *tokens):
         self.tokens = tokens
+        self.tokens_by_type = {}
+        for token in tokens:
+            self.tokens_by_type.setdefault(type(token), token)
 
     def has_time_range_token(self):
-        return any([isinstance(token, TimeRange) for token in self.tokens])
+        return self.get_time_range_token() is not None
 
     def get_time_range_token(self):
-        for token in self.tokens:
-            if isinstance(token, TimeRange):
-                return token
+        return self.tokens_by_type.get(TimeRange)
 
     def has_day_range_token(self):
-        return any([isinstance(token, DayRange) for token in self.tokens])
+        return self.get_day_range_token() is not None
 
     def get_day_range_token(self):
-        for token in self.tokens:
-            if isinstance(token, DayRange):
-                return token
+        return self.tokens_by_type.get(DayRange)
 
     def has_day_token(self):
-        return any([isinstance(token, DayToken) for token in self.tokens])
+        return self.get_day_token() is not None
 
     def get_day_token(self):
-        for token in self.tokens:
-            if isinstance(token, DayToken):
-                return token
+        return self.tokens_by_type.get(DayToken)
 
     def datetime(self, now):
         return self.tokens[0].datetime(now=now)
@@ -0,0 +1,120 @@
+from .categorize import DAY_OF_WEEK_LOOKUP
+from .categorize import RELATIVE_DAY_OFFSETS
+from .categorize import expand_year
+from .data import DayToken
+from .data import DayTimeToken
+from .data import TimeToken
+
+import datetime
+import re
+
+
+TIME = r'(\d{1,2})(?::(\d{2}))?\s*(?:([ap])\.?m\.?)?'
+DATE = r'(\d{1,2})/(\d{1,2})(?:/(\d{4}|\d{2}))?'
+
+TIME_PATTERN = re.compile(r'^\s*%s\s*$' % TIME, re.IGNORECASE)
+DATE_TIME_PATTERN = re.compile(r'^\s*%s(?:\s+%s)?\s*$' % (DATE, TIME), re.IGNORECASE)
+ISO_PATTERN = re.compile(
+    r'^\s*(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}))?\s*$')
+DAY_WORD_PATTERN = re.compile(r'^\s*([a-z]+)(?:\s+%s)?\s*$' % TIME, re.IGNORECASE)
+
+
+def match_fast_path(string, now=None):
+    """Build tokens directly for simple inputs, skipping the full pipeline.
+
+    Returns None if the string needs the general tokenizer and categorizer.
+
+    >>> now = datetime.datetime(2018, 8, 4)
+    >>> match_fast_path('3 pm', now)
+    [3 pm]
+    >>> match_fast_path('3:30 P.M.', now)
+    [3:30 pm]
+    >>> match_fast_path('15:00', now)
+    [3 pm]
+    >>> match_fast_path('3', now)
+    [3:00]
+    >>> match_fast_path('7/17', now)
+    [7/17/2018]
+    >>> match_fast_path('7/17/19 3:30 pm', now)
+    [7/17/2019 3:30 pm]
+    >>> match_fast_path('2018-07-17', now)
+    [7/17/2018]
+    >>> match_fast_path('2018-07-17T15:30', now)
+    [7/17/2018 3:30 pm]
+    >>> match_fast_path('Monday', now)
+    [8/6/2018]
+    >>> match_fast_path('sat 3 pm', now)
+    [8/4/2018 3 pm]
+    >>> match_fast_path('tomorrow 9am', now)
+    [8/5/2018 9 am]
+    >>> match_fast_path('July 17', now)
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    for pattern, handler in FAST_PATHS:
+        match = pattern.match(string)
+        if match:
+            tokens = handler(match, now)
+            if tokens is not None:
+                return tokens
+    return None
+
+
+def match_time(match, now):
+    return [time_token(*match.groups())]
+
+
+def match_date_time(match, now):
+    month, day, year, hour, minute, time_of_day = match.groups()
+    year = expand_year(int(year)) if year else now.year
+    day = DayToken(int(month), int(day), year)
+    if hour is None:
+        return [day]
+    return [day.combine(time_token(hour, minute, time_of_day))]
+
+
+def match_iso(match, now):
+    year, month, day, hour, minute = match.groups()
+    if hour is None:
+        return [DayToken(int(month), int(day), int(year))]
+    return [DayTimeToken(
+        int(year), int(month), int(day), int(hour), int(minute))]
+
+
+def match_day_word(match, now):
+    """Resolve a day of week or relative day, e.g., 'Monday' or 'today'.
+
+    Returns None if the word is neither.
+    """
+    name, hour, minute, time_of_day = match.groups()
+    weekday = DAY_OF_WEEK_LOOKUP.get(name.lower())
+    if weekday is not None:
+        days = (weekday - now.weekday()) % 7
+    elif name in RELATIVE_DAY_OFFSETS:
+        days = RELATIVE_DAY_OFFSETS[name]
+    else:
+        return None
+    date = now + datetime.timedelta(days)
+    day = DayToken(date.month, date.day, date.year)
+    if hour is None:
+        return [day]
+    return [day.combine(time_token(hour, minute, time_of_day))]
+
+
+FAST_PATHS = (
+    (TIME_PATTERN, match_time),
+    (DATE_TIME_PATTERN, match_date_time),
+    (ISO_PATTERN, match_iso),
+    (DAY_WORD_PATTERN, match_day_word),
+)
+
+
+def time_token(hour, minute, time_of_day):
+    """Build a time token from matched hour, minute and am/pm strings.
+
+    >>> time_token('3', None, 'P')
+    3 pm
+    """
+    if time_of_day:
+        time_of_day = time_of_day.lower() + 'm'
+    return TimeToken(int(hour), time_of_day, int(minute or 0))
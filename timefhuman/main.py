@@ -16,23 +16,22 @@ Convert human-readable date-like string to Python datetime object.
 from .tokenize import tokenize
 from .categorize import categorize
 from .tree import build_tree
+from .fastpath import match_fast_path
 from .data import Token
-from .data import TimeToken
-from .data import DayToken
-from .data import TimeRange
-from .data import DayRange
+import copy
 import datetime
-import string
+import functools
 
 
-__all__ = ('timefhuman',)
+__all__ = ('timefhuman', 'timefhuman_many')
 
 
-def timefhuman(string, now=None, raw=None):
+def timefhuman(string, now=None, raw=None, cache=True):
     """A simple parsing function for date-related strings.
 
     :param string: date-like string to parse
-    :param now: datetime for now, will default to datetime.datetime.now()
+    :param now: date or datetime for now, will default to datetime.datetime.now()
+    :param cache: reuse results for repeated (string, date of now) pairs
 
     >>> now = datetime.datetime(year=2018, month=8, day=4)
     >>> timefhuman('upcoming Monday noon', now=now)  # natural language
@@ -55,22 +54,63 @@ def timefhuman(string, now=None, raw=None):
     if now is None:
         now = datetime.datetime.now()
 
-    tokens = timefhuman_tokens(string, now)
-
     if raw:
-        return tokens
-    datetimes = [tok.datetime(now) for tok in tokens if isinstance(tok, Token)]
+        return timefhuman_tokens(string, now)
+    if not cache:
+        return timefhuman_datetimes(string, now)
 
-    if len(datetimes) == 1:  # TODO: bad idea?
-        return datetimes[0]
+    # now may be a date or a datetime
+    datetimes = timefhuman_cached(
+        string, datetime.date(now.year, now.month, now.day))
+    if isinstance(datetimes, list):  # do not hand out the cached list
+        return copy.deepcopy(datetimes)
     return datetimes
 
     # TODO: What if user specifies vernacular AND actual date time. Let
     # specified date time take precedence.
 
 
+def timefhuman_many(strings, now=None, raw=None, cache=True):
+    """Parse several date-related strings against a single `now`.
+
+    Accepts the same options as timefhuman. `now` is resolved once, so every
+    string is interpreted relative to the same moment.
+
+    >>> now = datetime.datetime(year=2018, month=8, day=4)
+    >>> timefhuman_many(['upcoming Monday noon', '7/17 3-4 PM'], now=now)
+    [datetime.datetime(2018, 8, 6, 12, 0), (datetime.datetime(2018, 7, 17, 15, 0), datetime.datetime(2018, 7, 17, 16, 0))]
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    return [timefhuman(string, now, raw, cache) for string in strings]
+
+
+@functools.lru_cache(maxsize=4096)
+def timefhuman_cached(string, today):
+    """Memoized timefhuman_datetimes.
+
+    Parsing only reads the year, month and day of now, so results are keyed
+    on the date alone.
+    """
+    now = datetime.datetime.combine(today, datetime.time())
+    return timefhuman_datetimes(string, now)
+
+
+def timefhuman_datetimes(string, now):
+    """Convert string into a datetime, tuple of datetimes or list of both"""
+    tokens = timefhuman_tokens(string, now)
+    datetimes = [tok.datetime(now) for tok in tokens if isinstance(tok, Token)]
+
+    if len(datetimes) == 1:  # TODO: bad idea?
+        return datetimes[0]
+    return datetimes
+
+
 def timefhuman_tokens(string, now):
     """Convert string into timefhuman parsed, imputed, combined tokens"""
+    tokens = match_fast_path(string, now)
+    if tokens is not None:
+        return tokens
     tokens = tokenize(string)
     tokens = categorize(tokens, now)
     tokens = build_tree(tokens, now)
@@ -8,11 +8,10 @@ from .data import DayList
 from .data import TimeList
 from .data import DayTimeList
 from .data import AmbiguousToken
+from .data import Token
 
-import datetime
 
-
-def build_tree(tokens, now=datetime.datetime.now()):
+def build_tree(tokens, now=None):
     """Assemble datetime object optionally using time.
 
     >>> build_tree([DayToken(7, 5, 2018), TimeToken(12, 'pm')])
@@ -27,7 +26,11 @@ def build_tree(tokens, now=datetime.datetime.now()):
     [[7/5/2018 11:00, 7/7/2018 11:00]]
     >>> build_tree([DayToken(7, 5, 2018), TimeToken(3, None), 'or', TimeToken(4, 'pm')])
     [[7/5/2018 3 pm, 7/5/2018 4 pm]]
+    >>> build_tree([DayToken(7, 5, 2018)])
+    [7/5/2018]
     """
+    if not tokens or (len(tokens) == 1 and isinstance(tokens[0], Token)):
+        return tokens  # nothing to combine
     tokens = combine_on_at(tokens)
     tokens = apply_ors(tokens)
     tokens = combine_days_and_times(tokens)
@@ -50,10 +53,7 @@ def areinstance(tokens, classes):
     """
     assert isinstance(classes, type) or isinstance(classes, tuple), \
         "Classes must either be a tuple or a type."
-    if isinstance(classes, type):
-        classes = (classes,)
-    return all([
-        any([isinstance(token, cls) for cls in classes]) for token in tokens])
+    return all(isinstance(token, classes) for token in tokens)
 
 
 def ifmatchinstance(tokens, classes):
@@ -74,9 +74,9 @@ def ifmatchinstance(tokens, classes):
     """
     if len(tokens) != len(classes):
         return 0
-    if all([isinstance(token, cls) for token, cls in zip(tokens, classes)]):
+    if all(isinstance(token, cls) for token, cls in zip(tokens, classes)):
         return 1
-    if all([isinstance(token, cls) for token, cls in zip(tokens[::-1], classes)]):
+    if all(isinstance(token, cls) for token, cls in zip(reversed(tokens), classes)):
         return -1
     return 0
 
@@ -201,10 +201,11 @@ def combine_days_and_times(tokens):
         amb_time_match = matchinstance(tokens[cursor:cursor+2], (AmbiguousToken, time_tokens))
         day_time_match = matchinstance(tokens[cursor:cursor+2], (day_tokens, time_tokens))
 
-        if amb_time_match and amb_time_match[0].has_day_token():
+        if amb_time_match:
             ambiguous, time = amb_time_match
             day = ambiguous.get_day_token()
-            day_time_match = (day, time)
+            if day is not None:
+                day_time_match = (day, time)
 
         if day_time_match:
             day, time = day_time_match